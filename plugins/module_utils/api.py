@@ -49,10 +49,28 @@ class AnsibleCloudscaleApi(object):
 
         self._auth_header = {'Authorization': 'Bearer %s' % module.params['api_token']}
 
+    def _api_endpoint(self, api_call):
+        # api_call might be full href already
+        if self._api_url not in api_call:
+            return self._api_url + api_call
+        return api_call
+
+    def _request(self, api_endpoint, method='GET', data=None):
+        # All calls to the API go through this method, so the headers and
+        # timeout only need to be taken care of in a single place.
+        headers = self._auth_header.copy()
+        if data is not None:
+            headers['Content-type'] = 'application/json'
+
+        return fetch_url(self._module,
+                         api_endpoint,
+                         headers=headers,
+                         method=method,
+                         data=data,
+                         timeout=self._module.params['api_timeout'])
+
     def _get(self, api_call):
-        resp, info = fetch_url(self._module, self._api_url + api_call,
-                               headers=self._auth_header,
-                               timeout=self._module.params['api_timeout'])
+        resp, info = self._request(self._api_endpoint(api_call))
 
         if info['status'] == 200:
             return self._module.from_json(to_text(resp.read(), errors='surrogate_or_strict'))
@@ -64,29 +82,16 @@ class AnsibleCloudscaleApi(object):
 
     def _post_or_patch(self, api_call, method, data, filter_none=True):
         # This helps with tags when we have the full API resource href to update.
-        if self._api_url not in api_call:
-            api_endpoint = self._api_url + api_call
-        else:
-            api_endpoint = api_call
+        api_endpoint = self._api_endpoint(api_call)
 
-        headers = self._auth_header.copy()
         if data is not None:
-            # Sanitize data dictionary
-            # Deepcopy: Duplicate the data object for iteration, because
-            # iterating an object and changing it at the same time is insecure
-            for k, v in deepcopy(data).items():
-                if filter_none and v is None:
-                    del data[k]
+            # Sanitize data dictionary, empty values like {} for tags are kept
+            if filter_none:
+                data = dict((k, v) for k, v in data.items() if v is not None)
 
             data = self._module.jsonify(data)
-            headers['Content-type'] = 'application/json'
 
-        resp, info = fetch_url(self._module,
-                               api_endpoint,
-                               headers=headers,
-                               method=method,
-                               data=data,
-                               timeout=self._module.params['api_timeout'])
+        resp, info = self._request(api_endpoint, method=method, data=data)
 
         if info['status'] in (200, 201):
             return self._module.from_json(to_text(resp.read(), errors='surrogate_or_strict'))
@@ -103,17 +108,9 @@ class AnsibleCloudscaleApi(object):
         return self._post_or_patch(api_call, 'PATCH', data, filter_none)
 
     def _delete(self, api_call):
-        # api_call might be full href already
-        if self._api_url not in api_call:
-            api_endpoint = self._api_url + api_call
-        else:
-            api_endpoint = api_call
+        api_endpoint = self._api_endpoint(api_call)
 
-        resp, info = fetch_url(self._module,
-                               api_endpoint,
-                               headers=self._auth_header,
-                               method='DELETE',
-                               timeout=self._module.params['api_timeout'])
+        resp, info = self._request(api_endpoint, method='DELETE')
 
         if info['status'] == 204:
             return None
@@ -285,12 +282,20 @@ class AnsibleCloudscaleBase(AnsibleCloudscaleApi):
         self._module.fail_json(msg=msg)
 
     def update(self, resource):
-        updated = False
+        patch_data = dict()
         for param in self.resource_update_param_keys:
-            updated = self._param_updated(param, resource) or updated
-
-        # Refresh if resource was updated in live mode
-        if updated and not self._module.check_mode:
+            patch_data.update(self._param_patch_data(param, resource))
+        return self._patch_resource(resource, patch_data)
+
+    def _patch_resource(self, resource, patch_data):
+        # Update all changed params with a single request and refresh the
+        # resource if it was updated in live mode
+        if patch_data and not self._module.check_mode:
+            href = resource.get('href')
+            if not href:
+                self._module.fail_json(msg='Unable to update %s, no href found.' % ', '.join(sorted(patch_data)))
+
+            self._patch(href, patch_data)
             resource = self.query()
         return resource
 
@@ -341,34 +346,29 @@ class AnsibleCloudscaleBase(AnsibleCloudscaleApi):
 
         return is_different
 
-    def _param_updated(self, key, resource):
+    def _param_patch_data(self, key, resource):
         param = self._module.params.get(key)
         if param is None:
-            return False
+            return dict()
 
         if not resource or key not in resource:
-            return False
+            return dict()
 
         is_different = self.find_difference(key, resource, param)
 
-        if is_different:
-            self._result['changed'] = True
+        if not is_different:
+            return dict()
 
-            patch_data = {
-                key: param
-            }
+        self._result['changed'] = True
 
-            self._result['diff']['before'].update({key: resource[key]})
-            self._result['diff']['after'].update(patch_data)
+        patch_data = {
+            key: param
+        }
 
-            if not self._module.check_mode:
-                href = resource.get('href')
-                if not href:
-                    self._module.fail_json(msg='Unable to update %s, no href found.' % key)
+        self._result['diff']['before'].update({key: resource[key]})
+        self._result['diff']['after'].update(patch_data)
 
-                self._patch(href, patch_data)
-                return True
-        return False
+        return patch_data
 
     def get_result(self, resource):
         if resource:
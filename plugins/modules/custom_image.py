@@ -228,9 +228,6 @@ state:
 from ansible.module_utils.basic import (
     AnsibleModule,
 )
-from ansible.module_utils.urls import (
-    fetch_url
-)
 from ..module_utils.api import (
     AnsibleCloudscaleBase,
     cloudscale_argument_spec,
@@ -271,11 +268,7 @@ class AnsibleCloudscaleCustomImage(AnsibleCloudscaleBase):
     # AnsibleCloudscaleCustomImage._get once the API bug is fixed.
     def _get_url(self, url):
 
-        response, info = fetch_url(self._module,
-                                   url,
-                                   headers=self._auth_header,
-                                   method='GET',
-                                   timeout=self._module.params['api_timeout'])
+        response, info = self._request(url)
 
         if info['status'] == 200:
             response = self._module.from_json(
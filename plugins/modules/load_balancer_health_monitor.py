@@ -291,57 +291,43 @@ class AnsibleCloudscaleLoadBalancerHealthMonitor(AnsibleCloudscaleBase):
         return self.pre_transform(self._resource_data)
 
     def update(self, resource):
-        updated = False
+        patch_data = dict()
         for param in self.resource_update_param_keys:
             if param == 'http' and self._module.params.get('http') is not None:
+                http_patch_data = dict()
                 for subparam in ALLOWED_HTTP_POST_PARAMS:
-                    updated = self._http_param_updated(subparam, resource) or updated
+                    http_patch_data.update(self._http_param_patch_data(subparam, resource))
+                if http_patch_data:
+                    patch_data['http'] = http_patch_data
             else:
-                updated = self._param_updated(param, resource) or updated
+                patch_data.update(self._param_patch_data(param, resource))
+        return self._patch_resource(resource, patch_data)
 
-        # Refresh if resource was updated in live mode
-        if updated and not self._module.check_mode:
-            resource = self.query()
-        return resource
-
-    def _http_param_updated(self, key, resource):
+    def _http_param_patch_data(self, key, resource):
         param_http = self._module.params.get('http')
         param = param_http[key]
 
         if param is None:
-            return False
+            return dict()
 
         if not resource or key not in resource['http']:
-            return False
+            return dict()
 
         is_different = self.find_http_difference(key, resource, param)
 
-        if is_different:
-            self._result['changed'] = True
-
-            patch_data = {
-                'http': {
-                    key: param
-                }
-            }
+        if not is_different:
+            return dict()
 
-            before_data = {
-                'http': {
-                    key: resource['http'][key]
-                }
-            }
+        self._result['changed'] = True
 
-            self._result['diff']['before'].update(before_data)
-            self._result['diff']['after'].update(patch_data)
+        patch_data = {
+            key: param
+        }
 
-            if not self._module.check_mode:
-                href = resource.get('href')
-                if not href:
-                    self._module.fail_json(msg='Unable to update %s, no href found.' % key)
+        self._result['diff']['before'].setdefault('http', dict()).update({key: resource['http'][key]})
+        self._result['diff']['after'].setdefault('http', dict()).update(patch_data)
 
-                self._patch(href, patch_data)
-                return True
-        return False
+        return patch_data
 
     def find_http_difference(self, key, resource, param):
         is_different = False